@@ -1,24 +1,38 @@
 #!/usr/bin/env python
+import collections
 import datetime
+import errno
+import functools
 import logging
+import logging.handlers
+import multiprocessing
 import os
 import sys
 import shutil
+import sqlite3
+import struct
+from concurrent.futures import ProcessPoolExecutor
 
-from docopt import docopt
+from docopt import docopt, DocoptExit
 
 from hachoir.parser import createParser
+from hachoir.parser.parser_list import HachoirParserList
 from hachoir.metadata import extractMetadata
+from hachoir.metadata.filter import DATETIME_FILTER
+from hachoir.metadata.metadata import extractors
 from hachoir.core import config
 
 usage = """Usage:
-  photocopy.py [options] <source_dir> <destination_dir>
+  op.py [options] <source_dir> <destination_dir>
 
 Options:
+  -c --cache=str           remember file dates in .op_dates.db in the destination (--cache=yes)
+                           or read every file again (--cache=no) [default: yes]
   -h --help                Show this help and exit.
   -j --extense=str         Extention list - comma separated [default: jpeg,jpg]. Supports all extensions of hachoir
   -m --move=str            move files (--move=yes) or copy (--move=no) [default: no, copy instead]
   -v --verbose             Talk more.
+  -w --workers=int         number of processes reading file dates, 1 reads them in this process [default: auto]
   -x --exifOnly=str        skip file processing if no EXIF (--exifOnly =yes)
                            or process files with no EXIF (--exifOnly =no)
                            or Only process files with no EXIF (--exifOnly =fs) [default: yes]
@@ -27,12 +41,12 @@ Examples:
     1. Simple. Copy jpg or JPG files from source (Z:\photosync) to target into folders
        named YYYY_MM_DD using the EXIF Creation Date in the JPG files. Ignore files without
        EXIF date, but log everything.
-        # python photocopy.py -j jpg Z:\photosync target/
+        # python op.py -j jpg Z:\photosync target/
 
     2. More complex. Move (-m yes) files by extensions shown from source (Z:\photosync) to target into folders
         named YYYY_MM_DD using the EXIF Creation Date in the files. File without EXIF date will use the file
         system creation date to name target folders. Log everything.
-        # python photocopy.py -m yes -x no -j gif,png,jpg,mov,mp4 Z:\photosync target/
+        # python op.py -m yes -x no -j gif,png,jpg,mov,mp4 Z:\photosync target/
 """
 
 config.quiet = True
@@ -40,11 +54,24 @@ config.quiet = True
 logger = logging.getLogger(__name__)
 myversion = "v. 1.2 Farfengruven"
 destination_dir = ""
-extList = []
-actMove = "no"
+extList = frozenset()
+actMove = False
 exifOnly = ""
-running_file = str(__file__)  # what is this file and where is it running
-print(str(running_file) + "\n" + "is the file")
+takeExif = False  # exifOnly resolved once: move/copy files with an EXIF date
+takeNoExif = False  # and files without one
+noMetaExt = frozenset()
+destDirs = {}  # destination subdirs known to exist, with their st_dev
+dateCache = (
+    None  # sqlite3 connection to the dates of earlier runs, None with --cache=no
+)
+notCached = object()  # cached_date result for a file the date cache knows nothing about
+FICLONE = 0x40049409  # Linux ioctl request number, from <linux/fs.h>
+# GIF, PSD, XCF: no date in hachoir
+NO_DATE_SIGNATURES = (b"GIF87a", b"GIF89a", b"8BPS", b"gimp xcf")
+workers = 1
+readAhead = 512  # files whose dates are requested before the first of them is processed
+pool = None  # ProcessPoolExecutor reading file dates, None to read them in this process
+workerLog = None  # per worker process: buffers the log records of the file being read
 
 
 def set_up_logging(arguments):
@@ -65,11 +92,118 @@ def set_up_logging(arguments):
     ch.setLevel(level)  # Set the logging level for the file handler
     formatter = logging.Formatter("%(message)s")  # Define the log message format
     ch.setFormatter(formatter)  # Set the formatter for the file handler
-    logger.addHandler(ch)  # Add the file handler to the logger
+    # Buffer records in memory and write them in batches, flushed on errors and at exit
+    mh = logging.handlers.MemoryHandler(1000, flushLevel=logging.ERROR, target=ch)
+    logger.addHandler(mh)  # Add the buffered file handler to the logger
+
+
+def no_metadata_extensions():
+    # Extensions hachoir only has parsers without a metadata extractor for, so they
+    # never yield a date
+    with_meta, without_meta = set(), set()
+    for parser in HachoirParserList.getInstance():
+        exts = {
+            "." + x.lower() for x in parser.getParserTags().get("file_ext", ()) if x
+        }
+        if parser in extractors:
+            with_meta.update(exts)
+        else:
+            without_meta.update(exts)
+    return frozenset(without_meta - with_meta)
+
+
+def read_fast_date(filename):
+    # Read the date of formats recognized by their first bytes without hachoir. Returns
+    # (date known, date or None); (False, None) leaves the file to hachoir
+    with open(filename, "rb") as f:
+        head = f.read(12)
+        if head.startswith(b"\xff\xd8"):
+            created_date = read_jpeg_exif_date(f)
+            return created_date is not None, created_date
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return read_png_date(f)
+        if head.startswith(NO_DATE_SIGNATURES):
+            logger.debug("File type has no creation date")
+            return True, None
+        if os.path.splitext(filename)[1].lower() in (".tif", ".tiff"):
+            # The EXIF block is the TIFF file itself, IFD0 is normally near the start
+            f.seek(0)
+            created_date = read_tiff_datetime(f.read(65536))
+            return created_date is not None, created_date
+    return False, None
+
+
+def read_jpeg_exif_date(f):
+    # Read the EXIF DateTime tag (hachoir's "creation_date") from the APP1 segment of an
+    # open JPEG file. None lets the caller fall back to hachoir
+    f.seek(2)  # Past the SOI marker
+    try:
+        while True:
+            marker, length = struct.unpack(">2sH", f.read(4))
+            # Not a marker, start of image data, or a length too short to skip by
+            if marker[0] != 0xFF or marker[1] == 0xDA or length < 2:
+                return None
+            if marker[1] == 0xE1:
+                segment = f.read(length - 2)
+                if segment[:6] == b"Exif\0\0":
+                    # No copy of the APP1 data
+                    return read_tiff_datetime(memoryview(segment)[6:])
+            else:
+                f.seek(length - 2, 1)
+    except struct.error:
+        return None
+
+
+def read_png_date(f):
+    # Read hachoir's creation_date of an open PNG file, the tIME chunk, hopping from
+    # chunk header to chunk header without reading the image data. Returns (is a
+    # readable PNG, date or None)
+    f.seek(8)  # Past the signature
+    try:
+        while True:
+            length, kind = struct.unpack(">I4s", f.read(8))
+            if kind == b"tIME":
+                return True, datetime.datetime(*struct.unpack(">HBBBBB", f.read(7)))
+            if kind == b"IEND":
+                return True, None
+            f.seek(length + 4, 1)  # Skip the chunk data and CRC
+    except (struct.error, ValueError):
+        return False, None
+
+
+def read_tiff_datetime(tiff):
+    # Find DateTime (0x0132) in IFD0 of a TIFF/EXIF block and parse it
+    order = {b"II": "<", b"MM": ">"}.get(bytes(tiff[:2]))
+    if not order:
+        return None
+    try:
+        ifd = struct.unpack_from(order + "I", tiff, 4)[0]
+        count = struct.unpack_from(order + "H", tiff, ifd)[0]
+        for i in range(count):
+            tag, kind, size, offset = struct.unpack_from(
+                order + "HHII", tiff, ifd + 2 + 12 * i
+            )
+            # ASCII "YYYY:MM:DD HH:MM:SS\0"
+            if tag == 0x0132 and kind == 2 and size >= 20:
+                value = bytes(tiff[offset : offset + 19]).decode("ascii")
+                return datetime.datetime.strptime(value, "%Y:%m:%d %H:%M:%S")
+    except (struct.error, UnicodeDecodeError, ValueError):
+        pass
+    return None
 
 
 def get_created_date(filename):
     # Get the creation date of the file using EXIF metadata
+    if os.path.splitext(filename)[1].lower() in noMetaExt:
+        logger.debug("No metadata extractor for file type")
+        return None
+    try:
+        known, created_date = read_fast_date(filename)
+        # hachoir drops dates outside 1850-2030, leave such files to it as well
+        if known and DATETIME_FILTER(created_date):
+            return created_date
+    except OSError:
+        pass
     created_date = None
     parser = createParser(filename)
     if not parser:
@@ -80,30 +214,46 @@ def get_created_date(filename):
         try:
             metadata = extractMetadata(parser)
         except Exception as err:
-            logger.debug("Metadata extraction error: %s" % err)
+            logger.debug("Metadata extraction error: %s", err)
             metadata = None
     if not metadata:
         logger.debug("Unable to extract metadata")
     else:
-        cd = metadata.getValues("creation_date")
-        if len(cd) > 0:
-            created_date = cd[0]
+        try:
+            # First value, without building a list
+            created_date = metadata.get("creation_date")
+        except ValueError:  # No creation date in the metadata
+            pass
     return created_date
 
 
 def main(args=None):
-    global destination_dir, extList, actMove, exifOnly
+    global destination_dir, extList, actMove, exifOnly, takeExif, takeNoExif, noMetaExt
+    global workers, pool, dateCache
+    # Printed here, not at import, so worker processes re-importing this file stay quiet
+    running_file = str(__file__)  # what is this file and where is it running
+    print(str(running_file) + "\n" + "is the file")
     if args is None:
         args = sys.argv[1:]
-    arguments = docopt(usage)
+    arguments = docopt(usage, argv=args)
 
     # Get file extensions from options
     extensions = arguments["--extense"]
-    extList = extensions.split(",")
-    extList[:] = ["." + x for x in extList]
+    extList = frozenset("." + x.lower() for x in extensions.split(","))
     # Options flags
-    actMove = arguments["--move"]
+    actMove = arguments["--move"] == "yes"
     exifOnly = arguments["--exifOnly"]
+    takeExif = exifOnly in ("yes", "no")
+    takeNoExif = exifOnly in ("no", "fs")
+    noMetaExt = no_metadata_extensions()
+    workers = arguments["--workers"]
+    if workers != "auto":
+        try:
+            workers = int(workers)
+        except ValueError:
+            workers = 0
+        if workers < 1:  # Checked before anything is logged or created
+            raise DocoptExit("--workers must be auto or a number of processes")
 
     source_dir = arguments["<source_dir>"]
     destination_dir = arguments["<destination_dir>"]
@@ -115,13 +265,32 @@ def main(args=None):
         + "++ Started: "
         + datetime.datetime.now().strftime("%Y/%m/%d %H:%M:%S")
     )
-    logger.debug("options: " + str(arguments))
+    logger.debug("options: %s", arguments)
     if not os.path.isdir(destination_dir):
         os.makedirs(destination_dir)
         logger.info("created: " + destination_dir)
     if os.path.isdir(source_dir):
-        # Main recursive function to process files
-        recursive_walk(source_dir)
+        if workers == "auto":
+            workers = default_workers(source_dir)
+        logger.debug("date reading processes: %d", workers)
+        if workers > 1:
+            pool = ProcessPoolExecutor(
+                workers, initializer=init_worker, initargs=(logger.level, noMetaExt)
+            )
+        if arguments["--cache"] == "yes":
+            try:
+                dateCache = open_date_cache()
+            except sqlite3.Error as err:
+                drop_date_cache(err)
+        try:
+            # Main recursive function to process files
+            recursive_walk(source_dir)
+        finally:
+            if pool:
+                # After an error, drop the dates still queued instead of reading them
+                pool.shutdown(cancel_futures=True)
+            if dateCache:
+                dateCache.close()
     else:
         logger.info("source dir not exists: " + source_dir)
     # Job ended
@@ -131,63 +300,322 @@ def main(args=None):
     logging.shutdown()
 
 
+def default_workers(folder):
+    # One date reading process per CPU, but only two on a spinning disk where parallel
+    # reads make the head seek back and forth. Without an answer from the OS, up to four
+    cpus = os.cpu_count() or 1
+    rotational = is_rotational(folder)
+    if rotational is None:
+        return min(4, cpus)
+    return min(2, cpus) if rotational else cpus
+
+
+def is_rotational(folder):
+    # Whether the folder is on a spinning disk, from Linux sysfs. None when not known
+    # (other systems, network and virtual filesystems)
+    if not sys.platform.startswith("linux"):
+        return None
+    dev = os.stat(folder).st_dev
+    block = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+    # A partition has no queue of its own, its disk is the parent directory
+    for queue in (block + "/queue/rotational", block + "/../queue/rotational"):
+        try:
+            with open(queue) as f:
+                return f.read().strip() == "1"
+        except OSError:
+            pass
+    return None
+
+
+def init_worker(level, no_meta_ext):
+    # Set up a worker process: keep its log records so they are returned with each date
+    global noMetaExt, workerLog
+    noMetaExt = no_meta_ext
+    # Build hachoir's parser registry now, not on the first file
+    HachoirParserList.getInstance()
+    workerLog = logging.handlers.BufferingHandler(sys.maxsize)
+    logger.handlers.clear()  # A forked worker must not write to events.log itself
+    logger.setLevel(level)
+    logger.addHandler(workerLog)
+
+
+def worker_created_date(filename):
+    # Get the created date in a worker process, with the messages logged meanwhile
+    workerLog.flush()
+    cd = get_created_date(filename)
+    return cd, [record.getMessage() for record in workerLog.buffer]
+
+
+def open_date_cache():
+    # Open the cache of file dates found by earlier runs, kept next to events.log
+    db = sqlite3.connect(os.path.join(destination_dir, ".op_dates.db"))
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS dates"
+        " (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, created TEXT)"
+    )
+    return db
+
+
+def drop_date_cache(err):
+    # Go on without the date cache after an sqlite error: a damaged .op_dates.db, one
+    # locked by another run, or a filesystem sqlite can't lock
+    global dateCache
+    logger.warning("Date cache not used: %s", err)
+    if dateCache:
+        dateCache.close()
+    dateCache = None
+
+
+def cached_date(entry):
+    # Get the date stored for an unchanged file by an earlier run, None if it had none,
+    # or notCached
+    stat = entry.stat()
+    row = dateCache.execute(
+        "SELECT created FROM dates WHERE path = ? AND size = ? AND mtime_ns = ?",
+        (os.path.abspath(entry.path), stat.st_size, stat.st_mtime_ns),
+    ).fetchone()
+    if not row:
+        return notCached
+    created = row[0]
+    if created is None:  # An earlier run found no date, don't parse the file again
+        return None
+    kind = datetime.datetime if "T" in created else datetime.date
+    return kind.fromisoformat(created)
+
+
+def date_row(entry, cd):
+    # The date cache row of a file, keyed by path, size and mtime. No date is kept as
+    # NULL
+    created = cd.isoformat() if isinstance(cd, datetime.date) else None
+    stat = entry.stat()
+    return os.path.abspath(entry.path), stat.st_size, stat.st_mtime_ns, created
+
+
+def store_dates(rows):
+    # Remember the dates for later runs, in one short transaction so other runs
+    # sharing the destination aren't locked out while files are copied
+    try:
+        with dateCache:
+            dateCache.executemany(
+                "INSERT OR REPLACE INTO dates VALUES (?, ?, ?, ?)", rows
+            )
+    except sqlite3.Error as err:
+        drop_date_cache(err)
+
+
+def created_dates(entries):
+    # Start getting the created dates of a folder's files. Dates cached by an earlier
+    # run are used as they are, the others are submitted to the worker pool now. Gives
+    # (entry, date) in order
+    cached = [notCached] * len(entries)
+    if dateCache:
+        try:
+            cached = [cached_date(entry) for entry in entries]
+        except sqlite3.Error as err:
+            drop_date_cache(err)
+    missing = [entry for entry, cd in zip(entries, cached) if cd is notCached]
+    paths = [entry.path for entry in missing]
+    if pool:
+        # Small chunks, so the first dates come back while the rest are read
+        chunksize = min(16, max(1, len(paths) // (workers * 4)))
+        results = pool.map(worker_created_date, paths, chunksize=chunksize)
+    else:
+        results = ((get_created_date(path), []) for path in paths)
+    return paired_dates(entries, cached, results)
+
+
+def paired_dates(entries, cached, results):
+    # Pair a folder's files with their dates as the reads complete, caching new dates.
+    # Not with --move=yes: the source paths are deleted, their rows would never match
+    rows = []
+    for entry, cd in zip(entries, cached):
+        if cd is notCached:
+            cd, messages = next(results)
+            for message in messages:
+                logger.debug("%s", message)
+            if dateCache and not actMove:
+                rows.append(date_row(entry, cd))
+        yield entry, cd
+    if dateCache and rows:
+        store_dates(rows)
+
+
+def scan_folders(folder):
+    # Yield each folder of the tree, top-down, with its files of the given extensions,
+    # None if it can't be read. os.scandir keeps each file's DirEntry, so its stat is
+    # fetched once and shared by the date lookup and moveFile
+    stack = [folder]  # Folders still to visit, explicit so deep trees can't overflow
+    while stack:
+        folder = stack.pop()
+        entries = []
+        subfolders = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subfolders.append(entry.path)
+                    elif entry.is_file():
+                        dot = entry.name.rfind(".")
+                        if dot > 0 and entry.name[dot:].lower() in extList:
+                            # Process only files with given extensions
+                            entries.append(entry)
+        except OSError as err:  # Unreadable, or gone since listed: skip it like os.walk
+            logger.debug("Cannot list %s: %s", folder, err.strerror)
+            entries = None
+        yield folder, entries
+        stack.extend(reversed(subfolders))  # Process nested folders, in listing order
+
+
+def folder_slices(folder):
+    # Yield the folders of scan_folders, a big one in slices of readAhead files, each
+    # with whether it continues the folder of the slice before
+    for folder, entries in scan_folders(folder):
+        if entries is None:
+            yield folder, None, False
+            continue
+        for start in range(0, len(entries) or 1, readAhead):  # An empty folder too
+            yield folder, entries[start : start + readAhead], start > 0
+
+
 def recursive_walk(folder):
-    # Recursively walk through the folder and process files
-    for folderName, subfolders, filenames in os.walk(folder):
-        logger.info("Source Folder: " + folderName)
-        for filename in filenames:
-            file_details = os.path.splitext(filename)
-            file_extension = file_details[1].lower()
-            # Process only files with given extensions
-            if file_extension in extList:
-                moveFile(folderName, filename)
-        if subfolders:  # Process nested folders
-            for subfolder in subfolders:
-                recursive_walk(subfolder)
-
-
-def moveFile(folder, filename):
-    # Move or copy file to the destination directory based on options
-    fullpath = os.path.join(folder, filename)
-    cd = get_created_date(fullpath)
+    # Recursively walk through the folder and process files. Dates are requested up to
+    # readAhead files ahead, across folders and in slices of big folders, so the
+    # worker pool keeps reading while files are copied
+    pending = collections.deque()  # (folder, number of files, dates, more) to process
+    ahead = 0
+    for folder, entries, more in folder_slices(folder):
+        if entries is None:
+            pending.append((folder, 0, None, more))
+        else:
+            pending.append((folder, len(entries), created_dates(entries), more))
+            ahead += len(entries)
+        while pending and (ahead >= readAhead or len(pending) > readAhead):
+            ahead -= process_folder(*pending.popleft())
+    while pending:
+        process_folder(*pending.popleft())
+
+
+def process_folder(folder, count, dates, more):
+    # Move or copy the files of one source folder, or of a further slice of it (more),
+    # returns how many there were
+    if dates is None:
+        logger.info("Source Folder not readable, skipped: %s", folder)
+        return count
+    if not more:
+        logger.info("Source Folder: %s", folder)
+    for entry, cd in dates:
+        moveFile(entry, cd)
+    return count
+
+
+def reflink(fsrc, fdst):
+    # Let the destination share the source's data blocks (FICLONE ioctl), True if the
+    # filesystem supports it (Btrfs, XFS, ...) and both files are on it
+    import fcntl
+
+    try:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        return False
+
+
+def fast_copy(src, dst):
+    # Copy a file like shutil.copy2 but let the OS move the bytes: on Linux a reflink,
+    # else copy_file_range (in-kernel copy). Other systems use shutil.copy2
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                if not reflink(fsrc, fdst):
+                    while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                        pass
+                # Some filesystems stop copy_file_range early, and fast_move deletes
+                # the source after us
+                complete = (
+                    os.fstat(fdst.fileno()).st_size == os.fstat(fsrc.fileno()).st_size
+                )
+            if complete:
+                shutil.copystat(src, dst)
+                return
+            logger.debug("Incomplete in-kernel copy, copying again: %s", src)
+        except OSError as err:
+            # Not supported for these files, shutil uses sendfile or a read loop
+            if err.errno not in (
+                errno.EXDEV,
+                errno.EINVAL,
+                errno.ENOSYS,
+                errno.EOPNOTSUPP,
+            ):
+                raise
+    shutil.copy2(src, dst)
+
+
+def fast_move(src, dst, same_device):
+    # Move a file with a single rename when it stays on one filesystem, else copy and
+    # delete it
+    if same_device:
+        try:
+            os.rename(src, dst)
+            return
+        except OSError as err:
+            if err.errno != errno.EXDEV:
+                raise
+    fast_copy(src, dst)
+    os.unlink(src)
+
+
+@functools.lru_cache(maxsize=4096)
+def date_folder(year, month, day):
+    # Name of the destination subdir for a date, YYYY_MM_DD. Cached, days repeat
+    return f"{year:04d}_{month:02d}_{day:02d}"
+
+
+def moveFile(entry, cd):
+    # Move or copy file to the destination directory based on options, cd is its EXIF
+    # date, if any
+    fullpath = entry.path
+    filename = entry.name
     comment = 9 * " "
+    take = takeExif
     if not cd:
-        cd = datetime.datetime.fromtimestamp(os.path.getmtime(fullpath))
+        cd = datetime.datetime.fromtimestamp(entry.stat().st_mtime)
         comment = " no EXIF "
-    created_date = cd.strftime("%Y_%m_%d")
+        take = takeNoExif
+    created_date = date_folder(cd.year, cd.month, cd.day)
     space = 40 - len(filename)
     if space <= 0:
         space = 4
     destf = os.path.join(destination_dir, created_date)
-    if not comment.isspace() and exifOnly == "yes":  # Skip file processing
-        logger.info(f"  {filename}  {comment:>{space}}    skipped")
-    else:
-
-        flagM = "moved" if actMove == "yes" else "copied"
-        if (
-            exifOnly == "no"
-            or (exifOnly == "yes" and comment.isspace())
-            or (exifOnly == "fs" and not comment.isspace())
-        ):  # Select by
-            if not os.path.isdir(destf):  # Create subdir to move/copy
+    if take:  # Select by
+        flagM = "moved" if actMove else "copied"
+        if destf not in destDirs:  # Create subdir to move/copy, checked once per run
+            try:
                 os.makedirs(destf)
                 logger.info(
-                    f"created new destination subdir: {destf}"
+                    "created new destination subdir: %s", destf
                 )  # now we log if we create the dest subdir
-            if not os.path.exists(os.path.join(destf, filename)):
-                if actMove == "yes":
-                    shutil.move(fullpath, destf)
-                else:
-                    shutil.copy2(fullpath, destf)
-                # logger.info('copy/move error' + error)
-                logger.info(
-                    f"  {filename}  {comment:>{space}}  {str(cd)} {flagM:>3} {destf}"
-                )
+            except FileExistsError:  # One mkdir instead of an isdir probe and a mkdir
+                pass
+            destDirs[destf] = os.stat(destf).st_dev
+        destpath = os.path.join(destf, filename)
+        if not os.path.exists(destpath):
+            if actMove:
+                # DirEntry reports st_dev 0 on Windows, there the rename finds out
+                same_device = entry.stat().st_dev in (destDirs[destf], 0)
+                fast_move(fullpath, destpath, same_device)
             else:
-                logger.info("  " + filename + " already exists in " + destf)
-        elif exifOnly == "fs" and comment.isspace():
-            logger.info(f"  {filename}  {comment:>{space}}    skipped")
+                fast_copy(fullpath, destpath)
+            # logger.info('copy/move error' + error)
+            logger.info(
+                "  %s  %*s  %s %3s %s", filename, space, comment, cd, flagM, destf
+            )
+        else:
+            logger.info("  %s already exists in %s", filename, destf)
+    elif exifOnly in ("yes", "fs"):  # Skip file processing
+        logger.info("  %s  %*s    skipped", filename, space, comment)
 
 
 if __name__ == "__main__":
+    # Needed by the worker processes of the Windows .exe
+    multiprocessing.freeze_support()
     main()
@@ -5,7 +5,7 @@ block_cipher = None
 
 
 a = Analysis(
-    ['photocopy.py'],
+    ['op.py'],
     pathex=[],
     binaries=[],
     datas=[],
@@ -27,7 +27,7 @@ exe = EXE(
     a.zipfiles,
     a.datas,
     [],
-    name='photocopy',
+    name='op',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
@@ -0,0 +1,109 @@
+import datetime
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+
+from hachoir.parser import createParser
+from hachoir.metadata import extractMetadata
+
+import op
+
+
+def tiff_block(order, date):
+    # TIFF/EXIF block with DateTime (0x0132) as the only IFD0 entry
+    e = "<" if order == b"II" else ">"
+    value = date.encode() + b"\0"
+    # Header, entry count, the entry pointing past itself to offset 26, no next IFD
+    header = order + struct.pack(e + "HI", 42, 8)
+    ifd0 = struct.pack(e + "HHHIII", 1, 0x0132, 2, len(value), 26, 0)
+    return header + ifd0 + value
+
+
+def jpeg(date, order=b"II"):
+    app1 = b"Exif\0\0" + tiff_block(order, date)
+    return b"\xff\xd8\xff\xe1" + struct.pack(">H", len(app1) + 2) + app1 + b"\xff\xd9"
+
+
+def png_chunk(kind, data):
+    crc = zlib.crc32(kind + data)
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
+
+
+def png(time=None):
+    chunks = [png_chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0))]
+    if time:
+        chunks.append(png_chunk(b"tIME", struct.pack(">HBBBBB", *time)))
+    chunks.append(png_chunk(b"IDAT", zlib.compress(b"\0\0")))
+    chunks.append(png_chunk(b"IEND", b""))
+    return b"\x89PNG\r\n\x1a\n" + b"".join(chunks)
+
+
+GIF = (
+    b"GIF89a\x01\x00\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+# name: (content, date hachoir finds)
+FIXTURES = {
+    "ii.jpg": (jpeg("2014:03:12 10:11:12"), datetime.datetime(2014, 3, 12, 10, 11, 12)),
+    "mm.jpg": (
+        jpeg("2015:01:02 03:04:05", b"MM"),
+        datetime.datetime(2015, 1, 2, 3, 4, 5),
+    ),
+    "ii.tif": (
+        tiff_block(b"II", "2016:07:08 09:10:11"),
+        datetime.datetime(2016, 7, 8, 9, 10, 11),
+    ),
+    "time.png": (png((2017, 4, 5, 6, 7, 8)), datetime.datetime(2017, 4, 5, 6, 7, 8)),
+    "plain.png": (png(), None),
+    "one.gif": (GIF, None),
+    "jpeg.png": (
+        jpeg("2018:09:10 11:12:13"),
+        datetime.datetime(2018, 9, 10, 11, 12, 13),
+    ),
+    "2040.jpg": (jpeg("2040:01:02 03:04:05"), None),
+    "short.jpg": (b"\xff\xd8\xff\xe1\x00\x00Exif\0\0\xff\xd9", None),
+}
+
+
+def hachoir_date(path):
+    # creation_date the way hachoir alone finds it
+    parser = createParser(path)
+    if not parser:
+        return None
+    with parser:
+        try:
+            metadata = extractMetadata(parser)
+        except Exception:
+            return None
+    if not metadata or not metadata.has("creation_date"):
+        return None
+    return metadata.get("creation_date")
+
+
+class GetCreatedDateTest(unittest.TestCase):
+    # The fast readers must give the dates hachoir gives
+    @classmethod
+    def setUpClass(cls):
+        op.noMetaExt = op.no_metadata_extensions()
+        cls.tmp = tempfile.TemporaryDirectory()
+        for name, (content, _) in FIXTURES.items():
+            with open(os.path.join(cls.tmp.name, name), "wb") as f:
+                f.write(content)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_same_date_as_hachoir(self):
+        for name, (_, expected) in FIXTURES.items():
+            with self.subTest(name):
+                path = os.path.join(self.tmp.name, name)
+                self.assertEqual(hachoir_date(path), expected)
+                self.assertEqual(op.get_created_date(path), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()